@@ -23,18 +23,13 @@ cli.py
 """
 import argparse
 import os
+import sys
 
 
-from journaldb.core import JournalEntry, init_journal_db
-from journaldb.models import search_entries
-from journaldb.pageio import (
-    JournalEntryData,
-    parse_file,
-    add_data_to_db,
-    update_data_in_db,
-    write_data_to_file,
-    write_template_file,
-)
+from journaldb.core import JournalEntry, init_db, init_whoosh_index
+
+# Whoosh and PyYAML are expensive to import relative to a single CLI
+# invocation, so each command imports only what it actually needs.
 
 
 def get_db_path(dbdir, dbname):
@@ -46,37 +41,73 @@ def get_db_path(dbdir, dbname):
 
 
 def add_command(db, ix, filename):
-    jed = parse_file(filename)
-    add_data_to_db(db, ix, jed)
+    from journaldb.models import close_batch_writer, open_batch_writer
+    from journaldb.pageio import add_data_to_db, parse_file
+    if not os.path.isdir(filename):
+        add_data_to_db(db, ix, parse_file(filename))
+        return
+    filenames = sorted(
+        os.path.join(filename, name) for name in os.listdir(filename)
+        if os.path.isfile(os.path.join(filename, name))
+    )
+    # Batch the whole directory: one Whoosh commit and one SQLite
+    # transaction instead of one of each per file.
+    writer = open_batch_writer(ix)
+    try:
+        db.connection.execute('BEGIN')
+        for fname in filenames:
+            add_data_to_db(db, writer, parse_file(fname))
+        db.connection.commit()
+    except Exception:
+        # rollback() is a no-op when no transaction is active, so a
+        # failure after an implicit commit can't raise a second error.
+        db.connection.rollback()
+        writer.cancel()
+        raise
+    close_batch_writer(writer)
 
 
 def update_command(db, ix, filename):
+    from journaldb.pageio import parse_file, update_data_in_db
     jed = parse_file(filename)
     update_data_in_db(db, ix, jed)
 
 
 def show_command(db, entry_id):
-    entry = JournalEntry.objects(db).get(id=entry_id)
+    entry = JournalEntry.get_fields(
+        db, entry_id, ('title', 'date', 'tags', 'content')
+    )
     if not entry:
         raise ValueError(f"Entry {entry_id} not in database")
-    print(f"Title: {entry['title']}\nDate: {entry['date']}\nTags: {entry['tags']}\n\nContent:\n{entry['content']}")
+    # Write the content directly instead of splicing it into an f-string,
+    # so a long entry is never duplicated in memory.
+    sys.stdout.write(f"Title: {entry['title']}\nDate: {entry['date']}\nTags: {entry['tags']}\n\nContent:\n")
+    sys.stdout.write(entry['content'])
+    sys.stdout.write('\n')
 
 
 def list_show_command(db):
-    entries = JournalEntry.all(db)
-    for entry in entries:
-        print(f"Id: {entry['id']} | Title: {entry['title']} | Date: {entry['date']}")
+    entries = JournalEntry.list_summary(db)
+    # One write() for the whole listing instead of one per row; this
+    # matters when the output is line-buffered or piped to a pager.
+    lines = [f"Id: {entry['id']} | Title: {entry['title']} | Date: {entry['date']}"
+             for entry in entries]
+    if lines:
+        sys.stdout.write('\n'.join(lines))
+        sys.stdout.write('\n')
 
 
 def write_command(db, entry_id, filename=None):
     entry = JournalEntry.objects(db).get(id=entry_id)
     if not entry:
         raise ValueError(f"Entry {entry_id} not in database")
+    from journaldb.pageio import write_data_to_file
     filename = filename if filename else 'entry.txt'
     write_data_to_file(entry, filename)
 
 
 def template_command(filename=None):
+    from journaldb.pageio import write_template_file
     filename = filename if filename else 'entry.txt'
     if os.path.exists(filename):
         raise FileExistsError(f"The file '{filename}' already exists.")
@@ -84,8 +115,20 @@ def template_command(filename=None):
     print(f"Template written at {filename}")
 
 
+def optimize_command(ix):
+    from journaldb.models import optimize_index
+    optimize_index(ix)
+    print("Search index optimized.")
+
+
 def search_command(db, ix, query_str, full=False):
-    results = search_entries(ix, query_str)
+    from journaldb.models import search_entries
+    if full:
+        results = search_entries(
+            ix, query_str, fields=("id", "title", "date", "tags", "content")
+        )
+    else:
+        results = search_entries(ix, query_str)
     if not results:
         print("No results found.")
         return
@@ -109,7 +152,7 @@ def make_parser():
     subparsers = parser.add_subparsers(dest='command', required=True)
 
     parser_add = subparsers.add_parser('add', help='Add a new journal entry from a file')
-    parser_add.add_argument('filename', help='The file to add to the database')
+    parser_add.add_argument('filename', help='The file (or directory of files) to add to the database')
 
     parser_update = subparsers.add_parser('update', help='Update a journal entry from a file')
     parser_update.add_argument('filename', help='The file to update in the database')
@@ -125,6 +168,8 @@ def make_parser():
     parser_template = subparsers.add_parser('template', help='Create a template file')
     parser_template.add_argument('filename', nargs='?', default=None, help='The file to write the template to (defaults to entry.txt)')
 
+    subparsers.add_parser('optimize', help='Merge search index segments accumulated by adds')
+
     parser_search = subparsers.add_parser('search', help='Search journal entries')
     parser_search.add_argument('query_str', help='The search query')
     parser_search.add_argument('--full', action='store_true', help='Show full entry information')
@@ -136,9 +181,11 @@ def main():
     parser = make_parser()
     args = parser.parse_args()
     db_path = get_db_path(args.dbdir, args.dbname)
-    db, ix = init_journal_db(
-        db_path, os.path.join(args.dbdir, "searchindex")
-    )
+    db = init_db(db_path)
+    # Only add/update/search touch the Whoosh index; everything else
+    # skips opening (or creating) it entirely.
+    if args.command in ('add', 'update', 'search', 'optimize'):
+        ix = init_whoosh_index(os.path.join(args.dbdir, "searchindex"))
 
     if args.command == 'add':
         add_command(db, ix, args.filename)
@@ -155,6 +202,8 @@ def main():
         write_command(db, args.id, args.filename)
     elif args.command == 'template':
         template_command(args.filename)
+    elif args.command == 'optimize':
+        optimize_command(ix)
     elif args.command == 'search':
         search_command(db, ix, args.query_str, full=args.full)
 
@@ -25,10 +25,6 @@ import json
 import os
 
 
-from whoosh import index
-from whoosh.fields import Schema, TEXT, ID, DATETIME
-
-
 from dbbase.core import DBBase
 from dbbase.models import Model, IntegerField, TextField, TimestampField
 from dbbase.query import QueryableModel
@@ -46,11 +42,80 @@ class JournalEntry(Model, QueryableModel):
     def __str__(self):
         return f"<JournalEntry(id={self.id}, title={self.title}, date={self.date}, tags={self.tags}, content_start={self.content[:50]})>"
 
+    @classmethod
+    def get_fields(cls, db, entry_id, fields):
+        """
+        Fetch a subset of columns for one entry, or None if it is absent.
+        """
+        row = db.connection.execute(
+            f"SELECT {', '.join(fields)} FROM {cls.table_name} WHERE id = ?",
+            (entry_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(fields, row))
 
-def init_journal_db(db_path: str, index_dir="indexdir"):
+    @classmethod
+    def list_summary(cls, db):
+        """
+        Fetch only (id, title, date) for every entry, ordered by date.
+
+        A listing never shows `content`, so projecting it out keeps the
+        query's IO proportional to the number of entries rather than the
+        total size of the journal.
+        """
+        cursor = db.connection.execute(
+            f"SELECT id, title, date FROM {cls.table_name} ORDER BY date"
+        )
+        return [
+            {'id': row[0], 'title': row[1], 'date': row[2]}
+            for row in cursor.fetchall()
+        ]
+
+
+def _tune_connection(db):
+    """
+    Apply SQLite pragmas suited to a single-user journal.
+
+    The default relaxed profile uses WAL with synchronous=NORMAL: a crash
+    can lose the most recent un-synced transaction but cannot corrupt the
+    database, and commits stop being fsync-bound. Set the environment
+    variable JOURNALDB_DURABILITY=strict to keep SQLite's fully durable
+    defaults instead.
+    """
+    if os.environ.get('JOURNALDB_DURABILITY', 'relaxed') == 'strict':
+        return
+    conn = db.connection
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+
+def init_db(db_path: str):
+    """
+    Initialize the SQLite database (without touching the search index).
+    """
     db = DBBase(db_path)
     db.connect()
+    _tune_connection(db)
     JournalEntry.create_table(db)
+    # Back the title/date lookup paths with indexes; otherwise every
+    # search_entries_by_title and date-ordered listing is a table scan.
+    db.connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_journal_entries_title_date "
+        "ON journal_entries(title, date)"
+    )
+    db.connection.execute(
+        "CREATE INDEX IF NOT EXISTS idx_journal_entries_date "
+        "ON journal_entries(date)"
+    )
+    return db
+
+
+def init_journal_db(db_path: str, index_dir="indexdir"):
+    db = init_db(db_path)
     ix = init_whoosh_index(index_dir)
     return db, ix
 
@@ -59,6 +124,9 @@ def create_whoosh_schema():
     """
     Define the Whoosh schema for journal entries.
     """
+    # Whoosh is imported here (not at module level) so that commands
+    # which never touch the index don't pay its import cost.
+    from whoosh.fields import Schema, TEXT, ID, DATETIME
     return Schema(
         id=ID(stored=True, unique=True),  # Unique ID for the journal entry
         title=TEXT(stored=True),
@@ -72,6 +140,7 @@ def init_whoosh_index(index_dir="indexdir"):
     """
     Initialize or open the Whoosh index.
     """
+    from whoosh import index
     if not os.path.exists(index_dir):
         os.mkdir(index_dir)
     if index.exists_in(index_dir):
@@ -21,21 +21,67 @@ models.py - db ORM
 #                 <http://www.gnu.org/licenses/>.
 # **********************************************************************
 """
+from contextlib import nullcontext
 from datetime import datetime
 
 
 from whoosh.qparser import MultifieldParser
+from whoosh.writing import IndexWriter
 
 
 from dbbase.core import DBBase
 from journaldb.core import JournalEntry
 
 
+def open_batch_writer(ix):
+    """
+    Open a writer for batching many index operations into one commit.
+
+    Pass the returned writer anywhere an `ix` is accepted below, then call
+    `close_batch_writer` once at the end. This turns N per-entry commits
+    (each an fsync of a new segment) into a single commit.
+    """
+    return ix.writer()
+
+
+def close_batch_writer(writer):
+    """
+    Commit a writer opened with `open_batch_writer`.
+    """
+    writer.commit(merge=False)
+
+
+def optimize_index(ix):
+    """
+    Merge the index down to a single segment.
+
+    Per-entry commits use merge=False to keep writes cheap, so small
+    segments accumulate over time; run this occasionally (via the
+    `journaldb optimize` command) to fold them back together.
+    """
+    ix.optimize()
+
+
+def _resolve_writer(ix):
+    """
+    Accept either an Index or an already-open IndexWriter.
+
+    Returns (writer, owned). When `owned` is True the caller opened the
+    writer itself and must commit it; when False the writer belongs to a
+    batch and the batch owner commits.
+    """
+    if isinstance(ix, IndexWriter):
+        return ix, False
+    return ix.writer(), True
+
+
 def add_entry_to_index(ix, entry_id, title, content, date, tags):
     """
     Add or update a journal entry in the Whoosh index.
+
+    `ix` may be an Index or a batch writer from `open_batch_writer`.
     """
-    writer = ix.writer()
+    writer, owned = _resolve_writer(ix)
     writer.add_document(
         id=str(entry_id),
         title=title,
@@ -43,27 +89,40 @@ def add_entry_to_index(ix, entry_id, title, content, date, tags):
         date=date,
         tags=tags
     )
-    writer.commit()
+    if owned:
+        writer.commit(merge=False)
 
 
 def create_entry(db: DBBase, ix, title: str, content: str, date: datetime, tags: str = ""):
     """
     Create a new journal entry and index it with Whoosh.
-    """
-    # Insert the entry into the SQLite database
-    JournalEntry.create(db, title=title, content=content, date=date, tags=tags)
 
-    # Get the entry ID and index the entry
-    # I assume title+date are unique.
-    entry = JournalEntry.get(db, title=title, date=date)
-    add_entry_to_index(ix, entry['id'], title, content, date, tags)
+    The insert and the index write happen inside one SQLite transaction:
+    the row is committed only after Whoosh accepted the document, so the
+    two syncs land back to back and an indexing failure rolls the row
+    back instead of leaving it unsearchable. A crash between the two
+    commits can still leave a row without an index document; (title,
+    date) acts as the natural key for finding and re-indexing those.
+
+    When the caller already holds a transaction (the directory batch
+    path), no new one is opened and the caller's commit covers the row.
+    """
+    ctx = nullcontext() if db.connection.in_transaction else db.connection
+    with ctx:
+        JournalEntry.create(db, title=title, content=content, date=date, tags=tags)
+        # last_insert_rowid() gives the autoincrement id without
+        # re-reading the row by (title, date).
+        entry_id = db.connection.execute("SELECT last_insert_rowid()").fetchone()[0]
+        add_entry_to_index(ix, entry_id, title, content, date, tags)
 
 
 def update_entry_in_index(ix, entry_id, title, content, date, tags):
     """
     Update a journal entry in the Whoosh index.
+
+    `ix` may be an Index or a batch writer from `open_batch_writer`.
     """
-    writer = ix.writer()
+    writer, owned = _resolve_writer(ix)
     writer.update_document(
         id=str(entry_id),
         title=title,
@@ -71,7 +130,8 @@ def update_entry_in_index(ix, entry_id, title, content, date, tags):
         date=date,
         tags=tags
     )
-    writer.commit()
+    if owned:
+        writer.commit(merge=False)
 
 
 def update_entry(db: DBBase, ix, entry_id, title: str = None,
@@ -100,8 +160,10 @@ def update_entry(db: DBBase, ix, entry_id, title: str = None,
     # Update the database
     JournalEntry.update(db, where={'id': entry_id}, updates=updated_fields)
 
-    # Update the Whoosh index
-    updated_entry = JournalEntry.get(db, id=entry_id)
+    # Update the Whoosh index from what we already have in memory,
+    # instead of re-reading the row we just wrote.
+    updated_entry = dict(entry)
+    updated_entry.update(updated_fields)
     update_entry_in_index(ix, entry_id, updated_entry['title'], updated_entry['content'], updated_entry['date'], updated_entry['tags'])
     print(f"Journal entry with ID {entry_id} has been updated.")
 
@@ -109,10 +171,13 @@ def update_entry(db: DBBase, ix, entry_id, title: str = None,
 def delete_entry_from_index(ix, entry_id):
     """
     Remove a journal entry from the Whoosh index.
+
+    `ix` may be an Index or a batch writer from `open_batch_writer`.
     """
-    writer = ix.writer()
+    writer, owned = _resolve_writer(ix)
     writer.delete_by_term('id', str(entry_id))
-    writer.commit()
+    if owned:
+        writer.commit(merge=False)
 
 
 def delete_entry(db: DBBase, ix, entry_id: int):
@@ -135,19 +200,65 @@ def delete_entry(db: DBBase, ix, entry_id: int):
     print(f"Journal entry with ID {entry_id} has been deleted.")
 
 
-def search_entries(ix, query_str):
+# Building a MultifieldParser constructs the whole query grammar, so
+# cache one per schema for repeated searches in the same process.
+_parser_cache = {}
+
+
+def _get_query_parser(ix):
+    key = id(ix.schema)
+    parser = _parser_cache.get(key)
+    if parser is None:
+        parser = MultifieldParser(["title", "content", "tags"], schema=ix.schema)
+        _parser_cache[key] = parser
+    return parser
+
+
+# Keep one searcher per index so repeated searches in the same process
+# don't reopen every segment reader. refresh() below picks up commits.
+_searcher_cache = {}
+
+
+def _get_searcher(ix):
+    key = id(ix)
+    searcher = _searcher_cache.get(key)
+    if searcher is None:
+        searcher = ix.searcher()
+    else:
+        # refresh() returns the same searcher when the index hasn't
+        # changed; otherwise it reopens only the new segments.
+        searcher = searcher.refresh()
+    _searcher_cache[key] = searcher
+    return searcher
+
+
+def close_searchers():
+    """
+    Close any cached searchers. Long-lived callers should invoke this on
+    shutdown; a one-shot CLI invocation can leave it to process exit.
+    """
+    while _searcher_cache:
+        _, searcher = _searcher_cache.popitem()
+        searcher.close()
+
+
+def search_entries(ix, query_str, fields=("id", "title")):
     """
     Search journal entries in the Whoosh index.
 
     :param ix: Whoosh index
     :param query_str: Search query
-    :return: List of matching entries
+    :param fields: Stored fields to materialize per hit; the default
+        covers the compact listing, so full entry text is only pulled
+        out of the index when a caller asks for it.
+    :return: List of (fields, score) pairs
     """
-    with ix.searcher() as searcher:
-        query = MultifieldParser(["title", "content", "tags"], schema=ix.schema).parse(query_str)
-        results = searcher.search(query)
-        ret = [(dict(result.items()), result.score) for result in results]
-        return ret
+    searcher = _get_searcher(ix)
+    query = _get_query_parser(ix).parse(query_str)
+    results = searcher.search(query)
+    ret = [({f: result[f] for f in fields}, result.score)
+           for result in results]
+    return ret
 
 
 def get_all_entries(db: DBBase):
@@ -0,0 +1,39 @@
+"""
+setup.py - optional mypyc compilation of the parsing hot path
+
+# **********************************************************************
+#       This is setup.py, part of journaldb
+#       Copyright (c) 2024 David Lowry-Duda <david@lowryduda.com>
+#       All Rights Reserved.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see
+#                 <http://www.gnu.org/licenses/>.
+# **********************************************************************
+
+Project metadata lives in pyproject.toml; this file only arranges for
+pageio.py (the string-heavy parsing hot path) to be compiled to a C
+extension with mypyc when it is available at build time. Without mypyc
+the build falls back to the pure-Python module unchanged.
+"""
+from setuptools import setup
+
+ext_modules = []
+try:
+    from mypyc.build import mypycify
+except ImportError:
+    pass
+else:
+    ext_modules = mypycify(["journaldb/pageio.py"])
+
+setup(ext_modules=ext_modules)